@@ -295,6 +295,9 @@ def format_annotation(annotation: Any, config: Config) -> str:  # noqa: C901, PL
     return f":py:{role}:`{prefix}{full_name}`{escape}{formatted_args}"
 
 
+_FUNCTION_DEF_RE = re.compile(r"^([^\S\n]*)(?:def |async def)", re.MULTILINE)
+
+
 # reference: https://github.com/pytorch/pytorch/pull/46548/files
 def normalize_source_lines(source_lines: str) -> str:
     """
@@ -307,36 +310,17 @@ def normalize_source_lines(source_lines: str) -> str:
     :param source_lines: source code
     :return: source lines that have been correctly aligned
     """
+    # Find the function definition (`def` or `async def`) and the whitespace leading it
+    match = _FUNCTION_DEF_RE.search(source_lines)
+    if match is None or not (whitespace := match[1]):
+        return source_lines
     lines = source_lines.split("\n")
-
-    def remove_prefix(text: str, prefix: str) -> str:
-        return text[text.startswith(prefix) and len(prefix) :]
-
-    # Find the line and line number containing the function definition
-    for pos, line in enumerate(lines):
-        if line.lstrip().startswith("def "):
-            idx = pos
-            whitespace_separator = "def"
-            break
-        if line.lstrip().startswith("async def"):
-            idx = pos
-            whitespace_separator = "async def"
-            break
-
-    else:
-        return "\n".join(lines)
-    fn_def = lines[idx]
-
-    # Get a string representing the amount of leading whitespace
-    whitespace = fn_def.split(whitespace_separator)[0]
+    idx = source_lines.count("\n", 0, match.start())
 
     # Add this leading whitespace to all lines before and after the `def`
-    aligned_prefix = [whitespace + remove_prefix(s, whitespace) for s in lines[:idx]]
-    aligned_suffix = [whitespace + remove_prefix(s, whitespace) for s in lines[idx + 1 :]]
-
-    # Put it together again
-    aligned_prefix.append(fn_def)
-    return "\n".join(aligned_prefix + aligned_suffix)
+    aligned = [whitespace + line.removeprefix(whitespace) for line in lines]
+    aligned[idx] = lines[idx]
+    return "\n".join(aligned)
 
 
 def process_signature(  # noqa: C901, PLR0913, PLR0917
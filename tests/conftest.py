@@ -30,6 +30,14 @@ def inv(pytestconfig: Config) -> Inventory:
     return inv
 
 
+@pytest.fixture(scope="session")
+def inv_roles(inv: Inventory) -> dict[str, str]:
+    roles: dict[str, str] = {}
+    for obj in inv.objects:
+        roles.setdefault(obj.name, "func" if obj.role == "function" else obj.role)
+    return roles
+
+
 @pytest.fixture(autouse=True)
 def _remove_sphinx_projects(sphinx_test_tempdir: Path) -> None:
     # Remove any directory which appears to be a Sphinx project from
@@ -19,7 +19,7 @@ from typing import (  # no type comments
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator, Callable
+    from collections.abc import AsyncGenerator, Callable, Iterator
     from io import StringIO
     from mailbox import Mailbox
     from types import CodeType, ModuleType
@@ -30,10 +30,14 @@ T = TypeVar("T")
 W = NewType("W", str)
 
 
+_VALUES: list[Any] = []
+
+
 def expected(expected: str, **options: dict[str, Any]) -> Callable[[T], T]:
     def dec(val: T) -> T:
         val.EXPECTED = expected
         val.OPTIONS = options
+        _VALUES.append(val)
         return val
 
     return dec
@@ -1434,12 +1438,17 @@ configs = {
 }
 
 
-@pytest.mark.parametrize("val", [x for x in globals().values() if hasattr(x, "EXPECTED")])
+@pytest.fixture(scope="module", autouse=True)
+def _mod_alias() -> Iterator[None]:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setitem(sys.modules, "mod", sys.modules[__name__])
+        yield
+
+
+@pytest.mark.parametrize("val", _VALUES)
 @pytest.mark.parametrize("conf_run", ["default_conf", "prolog_conf", "epilog_conf", "bothlog_conf"])
 @pytest.mark.sphinx("text", testroot="integration")
-def test_integration(
-    app: SphinxTestApp, status: StringIO, warning: StringIO, monkeypatch: pytest.MonkeyPatch, val: Any, conf_run: str
-) -> None:
+def test_integration(app: SphinxTestApp, status: StringIO, warning: StringIO, val: Any, conf_run: str) -> None:
     if isclass(val) and issubclass(val, BaseException):
         template = AUTO_EXCEPTION
     elif isclass(val):
@@ -1450,7 +1459,6 @@ def test_integration(
     (Path(app.srcdir) / "index.rst").write_text(template.format(val.__name__))
     app.config.__dict__.update(configs[conf_run])
     app.config.__dict__.update(val.OPTIONS)
-    monkeypatch.setitem(sys.modules, "mod", sys.modules[__name__])
     app.build()
     assert "build succeeded" in status.getvalue()  # Build succeeded
 
@@ -1464,10 +1472,6 @@ def test_integration(
 
     result = (Path(app.srcdir) / "_build/text/index.txt").read_text()
 
-    expected = val.EXPECTED
-    try:
-        assert result.strip() == dedent(expected).strip()
-    except Exception:
-        indented = indent(f'"""\n{result}\n"""', " " * 4)
-        print(f"@expected(\n{indented}\n)\n")  # noqa: T201
-        raise
+    assert result.strip() == dedent(val.EXPECTED).strip(), "@expected(\n{}\n)".format(
+        indent(f'"""\n{result}\n"""', " " * 4)
+    )
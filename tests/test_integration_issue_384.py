@@ -9,7 +9,7 @@ from typing import TYPE_CHECKING, Any, NewType, TypeVar
 import pytest
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
     from io import StringIO
 
     from sphinx.testing.util import SphinxTestApp
@@ -18,10 +18,14 @@ T = TypeVar("T")
 W = NewType("W", str)
 
 
+_VALUES: list[Any] = []
+
+
 def expected(expected: str, **options: dict[str, Any]) -> Callable[[T], T]:
     def dec(val: T) -> T:
         val.EXPECTED = expected
         val.OPTIONS = options
+        _VALUES.append(val)
         return val
 
     return dec
@@ -79,23 +83,27 @@ def function(x: int = 5, y: int = 10, z: int = 15) -> str:
     """
 
 
+AUTO_FUNCTION = ".. autofunction:: mod.{}"
+
 # Config settings for each test run.
 # Config Name: Sphinx Options as Dict.
 configs = {"default_conf": {"typehints_defaults": "braces-after"}}
 
 
-@pytest.mark.parametrize("val", [x for x in globals().values() if hasattr(x, "EXPECTED")])
+@pytest.fixture(scope="module", autouse=True)
+def _mod_alias() -> Iterator[None]:
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setitem(sys.modules, "mod", sys.modules[__name__])
+        yield
+
+
+@pytest.mark.parametrize("val", _VALUES)
 @pytest.mark.parametrize("conf_run", list(configs.keys()))
 @pytest.mark.sphinx("text", testroot="integration")
-def test_integration(
-    app: SphinxTestApp, status: StringIO, warning: StringIO, monkeypatch: pytest.MonkeyPatch, val: Any, conf_run: str
-) -> None:
-    template = ".. autofunction:: mod.{}"
-
-    (Path(app.srcdir) / "index.rst").write_text(template.format(val.__name__))
+def test_integration(app: SphinxTestApp, status: StringIO, warning: StringIO, val: Any, conf_run: str) -> None:
+    (Path(app.srcdir) / "index.rst").write_text(AUTO_FUNCTION.format(val.__name__))
     app.config.__dict__.update(configs[conf_run])
     app.config.__dict__.update(val.OPTIONS)
-    monkeypatch.setitem(sys.modules, "mod", sys.modules[__name__])
     app.build()
     assert "build succeeded" in status.getvalue()  # Build succeeded
 
@@ -109,10 +117,6 @@ def test_integration(
 
     result = (Path(app.srcdir) / "_build/text/index.txt").read_text()
 
-    expected = val.EXPECTED
-    try:
-        assert result.strip() == dedent(expected).strip()
-    except Exception:
-        indented = indent(f'"""\n{result}\n"""', " " * 4)
-        print(f"@expected(\n{indented}\n)\n")  # noqa: T201
-        raise
+    assert result.strip() == dedent(val.EXPECTED).strip(), "@expected(\n{}\n)".format(
+        indent(f'"""\n{result}\n"""', " " * 4)
+    )
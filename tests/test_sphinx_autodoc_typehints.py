@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import csv
 import re
 import sys
 import types
@@ -12,6 +13,7 @@ from textwrap import dedent, indent
 from types import EllipsisType, FrameType, FunctionType, ModuleType, NotImplementedType, TracebackType
 from typing import (  # noqa: UP035
     IO,
+    TYPE_CHECKING,
     Any,
     AnyStr,
     Dict,
@@ -24,12 +26,10 @@ from typing import (  # noqa: UP035
     TypeVar,
     Union,
 )
-from unittest.mock import create_autospec, patch
+from unittest.mock import patch
 
 import pytest
 import typing_extensions
-from sphinx.application import Sphinx
-from sphinx.config import Config
 
 from sphinx_autodoc_typehints import (
     _resolve_type_guarded_imports,
@@ -42,9 +42,10 @@ from sphinx_autodoc_typehints import (
     process_docstring,
 )
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.config import Config
     from sphinx.testing.util import SphinxTestApp
-    from sphobjinv import Inventory
 
 T = TypeVar("T")
 U_co = TypeVar("U_co", covariant=True)
@@ -106,6 +107,17 @@ class HintedMethods:
 
 
 PY312_PLUS = sys.version_info >= (3, 12)
+_ANNOTATION_GLOBALS = globals()
+
+
+class _Config(types.SimpleNamespace):
+    def __getitem__(self, name: str) -> Any:
+        return getattr(self, name)
+
+
+def _conf(**kwargs: Any) -> Config:
+    # a plain namespace stands in for Config; only attribute and item access are needed
+    return typing.cast("Config", _Config(**kwargs))
 
 
 @pytest.mark.parametrize(
@@ -370,64 +382,52 @@ _CASES = [
 ]
 
 
-@pytest.mark.parametrize(("annotation", "expected_result"), _CASES)
-def test_format_annotation(inv: Inventory, annotation: Any, expected_result: str) -> None:
-    conf = create_autospec(Config, _annotation_globals=globals(), always_use_bars_union=False)
+_ROLE_RE = re.compile(r"^:py:(?P<role>class|data|func):`~(?P<name>[^`]+)`")
+_FULLY_QUALIFIED_RE = re.compile(rf"~(?=typing|collections\.abc|numpy|{re.escape(__name__)})")
+
+
+def _check_format_annotation(annotation: Any, expected_result: str) -> str:
+    conf = _conf(_annotation_globals=_ANNOTATION_GLOBALS, always_use_bars_union=False)
     result = format_annotation(annotation, conf)
     assert result == expected_result
 
-    # Test with the "simplify_optional_unions" flag turned off:
-    if re.match(r"^:py:data:`~typing\.Union`\\\[.*``None``.*]", expected_result):
-        # strip None - argument and copy string to avoid conflicts with
-        # subsequent tests
-        expected_result_not_simplified = expected_result.replace(", ``None``", "")
-        # encapsulate Union in typing.Optional
-        expected_result_not_simplified += ":py:data:`~typing.Optional`\\ \\["
-        expected_result_not_simplified += "]"
-        conf = create_autospec(
-            Config,
-            simplify_optional_unions=False,
-            _annotation_globals=globals(),
-            always_use_bars_union=False,
-        )
-        assert format_annotation(annotation, conf) == expected_result_not_simplified
-
-        # Test with the "fully_qualified" flag turned on
-        if "typing" in expected_result_not_simplified:
-            expected_result_not_simplified = expected_result_not_simplified.replace("~typing", "typing")
-            conf = create_autospec(
-                Config,
-                typehints_fully_qualified=True,
-                simplify_optional_unions=False,
-                _annotation_globals=globals(),
-            )
-            assert format_annotation(annotation, conf) == expected_result_not_simplified
-
     # Test with the "fully_qualified" flag turned on
     if "typing" in expected_result or __name__ in expected_result:
-        expected_result = expected_result.replace("~typing", "typing")
-        expected_result = expected_result.replace("~collections.abc", "collections.abc")
-        expected_result = expected_result.replace("~numpy", "numpy")
-        expected_result = expected_result.replace("~" + __name__, __name__)
-        conf = create_autospec(
-            Config,
+        expected_result = _FULLY_QUALIFIED_RE.sub("", expected_result)
+        conf = _conf(
             typehints_fully_qualified=True,
-            _annotation_globals=globals(),
+            _annotation_globals=_ANNOTATION_GLOBALS,
             always_use_bars_union=False,
         )
         assert format_annotation(annotation, conf) == expected_result
 
-    # Test for the correct role (class vs data) using the official Sphinx inventory
-    if any(modname in expected_result for modname in ("typing", "types")):
-        m = re.match(r"^:py:(?P<role>class|data|func):`~(?P<name>[^`]+)`", result)
-        assert m, "No match"
-        name = m.group("name")
-        expected_role = next((o.role for o in inv.objects if o.name == name), None)
-        if expected_role:
-            if expected_role == "function":
-                expected_role = "func"
+    return result
+
+
+def _uses_inventory(case: Any) -> bool:
+    return any(modname in case.values[1] for modname in ("typing", "types"))
 
-            assert m.group("role") == expected_role
+
+_STATIC_CASES = [case for case in _CASES if not _uses_inventory(case)]
+_TYPING_CASES = [case for case in _CASES if _uses_inventory(case)]
+
+
+@pytest.mark.parametrize(("annotation", "expected_result"), _STATIC_CASES)
+def test_format_annotation_static(annotation: Any, expected_result: str) -> None:
+    _check_format_annotation(annotation, expected_result)
+
+
+@pytest.mark.parametrize(("annotation", "expected_result"), _TYPING_CASES)
+def test_format_annotation_typing(inv_roles: dict[str, str], annotation: Any, expected_result: str) -> None:
+    result = _check_format_annotation(annotation, expected_result)
+
+    # Test for the correct role (class vs data) using the official Sphinx inventory
+    m = _ROLE_RE.match(result)
+    assert m, "No match"
+    name = m.group("name")
+    expected_role = inv_roles.get(name)
+    if expected_role:
+        assert m.group("role") == expected_role
 
 
 @pytest.mark.parametrize(
@@ -444,7 +444,7 @@ def test_format_annotation(inv: Inventory, annotation: Any, expected_result: str
     ],
 )
 def test_always_use_bars_union(annotation: str, expected_result: str) -> None:
-    conf = create_autospec(Config, always_use_bars_union=True)
+    conf = _conf(always_use_bars_union=True)
     result = format_annotation(eval(annotation), conf)  # noqa: S307
     assert result == expected_result
 
@@ -468,20 +468,20 @@ def test_format_annotation_both_libs(library: ModuleType, annotation: str, param
         return  # pragma: no cover
 
     ann = annotation_cls if params is None else annotation_cls[params]
-    result = format_annotation(ann, create_autospec(Config))
+    result = format_annotation(ann, _conf())
     assert result == expected_result
 
 
 def test_process_docstring_slot_wrapper() -> None:
     lines: list[str] = []
-    config = create_autospec(
-        Config,
+    config = _conf(
         typehints_fully_qualified=False,
         simplify_optional_unions=False,
         typehints_formatter=None,
         autodoc_mock_imports=[],
+        autodoc_type_aliases={},
     )
-    app: Sphinx = create_autospec(Sphinx, config=config)
+    app = typing.cast("Sphinx", types.SimpleNamespace(config=config))
     process_docstring(app, "class", "SlotWrapper", Slotted, None, lines)
     assert not lines
 
@@ -493,6 +493,30 @@ def set_python_path() -> None:
         sys.path.insert(0, str(test_path))
 
 
+def set_master_doc(app: SphinxTestApp, master_doc: str) -> None:
+    app.config.master_doc = master_doc  # create flag
+    # The dummy testroot holds several unrelated documents, only read and write the one under test.
+    app.config.include_patterns = [f"{master_doc}.rst"]
+
+
+_EXPECTED_PARAM_TYPES = dedent(
+    """\
+    dummy_module.undocumented_function(x)
+
+       Hi{undoc_params_0}
+
+       Return type:
+          "str"
+
+    class dummy_module.DataClass(x)
+
+       Class docstring.{undoc_params_0}
+
+       __init__(x){undoc_params_1}
+    """
+)
+
+
 @pytest.mark.parametrize("always_document_param_types", [True, False], ids=["doc_param_type", "no_doc_param_type"])
 @pytest.mark.sphinx("text", testroot="dummy")
 @patch("sphinx.writers.text.MAXWIDTH", 2000)
@@ -506,10 +530,8 @@ def test_always_document_param_types(
 
     app.config.always_document_param_types = always_document_param_types  # create flag
     app.config.autodoc_mock_imports = ["mailbox"]  # create flag
+    set_master_doc(app, "index")
 
-    # Prevent "document isn't included in any toctree" warnings
-    for f in Path(app.srcdir).glob("*.rst"):
-        f.unlink()
     (Path(app.srcdir) / "index.rst").write_text(
         dedent(
             """
@@ -527,30 +549,11 @@ def test_always_document_param_types(
     assert "build succeeded" in status.getvalue()  # Build succeeded
     assert not warning.getvalue().strip()
 
-    format_args = {}
-    for indentation_level in range(2):
-        key = f"undoc_params_{indentation_level}"
-        if always_document_param_types:
-            format_args[key] = indent('\n\n   Parameters:\n      **x** ("int")', "   " * indentation_level)
-        else:
-            format_args[key] = ""
-
+    undoc_params = '\n\n   Parameters:\n      **x** ("int")' if always_document_param_types else ""
     contents = (Path(app.srcdir) / "_build/text/index.txt").read_text()
-    expected_contents = """\
-    dummy_module.undocumented_function(x)
-
-       Hi{undoc_params_0}
-
-       Return type:
-          "str"
-
-    class dummy_module.DataClass(x)
-
-       Class docstring.{undoc_params_0}
-
-       __init__(x){undoc_params_1}
-    """
-    expected_contents = dedent(expected_contents).format(**format_args)
+    expected_contents = _EXPECTED_PARAM_TYPES.format(
+        undoc_params_0=undoc_params, undoc_params_1=indent(undoc_params, "   ")
+    )
     assert contents == expected_contents
 
 
@@ -565,38 +568,42 @@ def maybe_fix_py310(expected_contents: str) -> str:
     return expected_contents
 
 
+_EXPECTED_FUTURE_ANNOTATIONS = maybe_fix_py310(
+    dedent(
+        """\
+        Dummy Module
+        ************
+
+        dummy_module_future_annotations.function_with_py310_annotations(self, x, y, z=None)
+
+           Method docstring.
+
+           Parameters:
+              * **x** ("bool" | "None") -- foo
+
+              * **y** ("int" | "str" | "float") -- bar
+
+              * **z** ("str" | "None") -- baz
+
+           Return type:
+              "str"
+        """
+    )
+)
+
+
 @pytest.mark.sphinx("text", testroot="dummy")
 @patch("sphinx.writers.text.MAXWIDTH", 2000)
 def test_sphinx_output_future_annotations(app: SphinxTestApp, status: StringIO) -> None:
     set_python_path()
 
-    app.config.master_doc = "future_annotations"  # create flag
+    set_master_doc(app, "future_annotations")
     app.build()
 
     assert "build succeeded" in status.getvalue()  # Build succeeded
 
     contents = (Path(app.srcdir) / "_build/text/future_annotations.txt").read_text()
-    expected_contents = """\
-    Dummy Module
-    ************
-
-    dummy_module_future_annotations.function_with_py310_annotations(self, x, y, z=None)
-
-       Method docstring.
-
-       Parameters:
-          * **x** ("bool" | "None") -- foo
-
-          * **y** ("int" | "str" | "float") -- bar
-
-          * **z** ("str" | "None") -- baz
-
-       Return type:
-          "str"
-    """
-    expected_contents = dedent(expected_contents)
-    expected_contents = maybe_fix_py310(dedent(expected_contents))
-    assert contents == expected_contents
+    assert contents == _EXPECTED_FUTURE_ANNOTATIONS
 
 
 @pytest.mark.sphinx("pseudoxml", testroot="dummy")
@@ -604,7 +611,7 @@ def test_sphinx_output_future_annotations(app: SphinxTestApp, status: StringIO)
 def test_sphinx_output_default_role(app: SphinxTestApp, status: StringIO) -> None:
     set_python_path()
 
-    app.config.master_doc = "simple_default_role"  # create flag
+    set_master_doc(app, "simple_default_role")
     app.config.default_role = "literal"
     app.build()
 
@@ -633,6 +640,26 @@ def test_sphinx_output_default_role(app: SphinxTestApp, status: StringIO) -> Non
     assert foo_param == expected_foo_param
 
 
+_EXPECTED_SIMPLE = dedent(
+    """\
+    Simple Module
+    *************
+
+    dummy_module_simple.function{signature}
+
+       Function docstring.
+
+       Parameters:
+          * **x** {x}
+
+          * **y** {y}
+
+       Return type:
+          {rtype}
+    """
+)
+
+
 @pytest.mark.parametrize(
     ("defaults_config_val", "expected"),
     [
@@ -653,7 +680,7 @@ def test_sphinx_output_defaults(
 ) -> None:
     set_python_path()
 
-    app.config.master_doc = "simple"  # create flag
+    set_master_doc(app, "simple")
     app.config.typehints_defaults = defaults_config_val  # create flag
     if isinstance(expected, Exception):
         with pytest.raises(Exception, match=re.escape(str(expected))):
@@ -663,23 +690,7 @@ def test_sphinx_output_defaults(
     assert "build succeeded" in status.getvalue()
 
     contents = (Path(app.srcdir) / "_build/text/simple.txt").read_text()
-    expected_contents = f"""\
-    Simple Module
-    *************
-
-    dummy_module_simple.function(x, y=1)
-
-       Function docstring.
-
-       Parameters:
-          * **x** ("bool") -- foo
-
-          * **y** {expected}
-
-       Return type:
-          "str"
-    """
-    assert contents == dedent(expected_contents)
+    assert contents == _EXPECTED_SIMPLE.format(signature="(x, y=1)", x='("bool") -- foo', y=expected, rtype='"str"')
 
 
 @pytest.mark.parametrize(
@@ -700,7 +711,7 @@ def test_sphinx_output_formatter(
 ) -> None:
     set_python_path()
 
-    app.config.master_doc = "simple"  # create flag
+    set_master_doc(app, "simple")
     app.config.typehints_formatter = formatter_config_val  # create flag
     if isinstance(expected, Exception):
         with pytest.raises(Exception, match=re.escape(str(expected))):
@@ -710,87 +721,67 @@ def test_sphinx_output_formatter(
     assert "build succeeded" in status.getvalue()
 
     contents = (Path(app.srcdir) / "_build/text/simple.txt").read_text()
-    expected_contents = f"""\
-    Simple Module
-    *************
+    assert contents == _EXPECTED_SIMPLE.format(signature="(x, y=1)", x=expected[0], y=expected[1], rtype=expected[2])
 
-    dummy_module_simple.function(x, y=1)
 
-       Function docstring.
-
-       Parameters:
-          * **x** {expected[0]}
+def test_normalize_source_lines_async_def() -> None:
+    source = dedent(
+        """
+        async def async_function():
+            class InnerClass:
+                def __init__(self): ...
+        """
+    )
 
-          * **y** {expected[1]}
+    assert normalize_source_lines(source) == source
 
-       Return type:
-          {expected[2]}
-    """
-    assert contents == dedent(expected_contents)
 
+def test_normalize_source_lines_def_starting_decorator_parameter() -> None:
+    source = dedent(
+        """
+        @_with_parameters(
+            _Parameter("self", _Parameter.POSITIONAL_OR_KEYWORD),
+            *_proxy_instantiation_parameters,
+            _project_id,
+            _Parameter(
+                "node_numbers",
+                _Parameter.POSITIONAL_OR_KEYWORD,
+                default=None,
+                annotation=Optional[Iterable[int]],
+            ),
+        )
+        def __init__(bound_args):  # noqa: N805
+            ...
+        """
+    )
 
-def test_normalize_source_lines_async_def() -> None:
-    source = """
-    async def async_function():
-        class InnerClass:
-            def __init__(self): ...
-    """
+    assert normalize_source_lines(source) == source
 
-    expected = """
-    async def async_function():
-        class InnerClass:
-            def __init__(self): ...
-    """
 
-    assert normalize_source_lines(dedent(source)) == dedent(expected)
+def test_normalize_source_lines_indented_def_with_decorator() -> None:
+    source = "@decorator(\n  arg,\n)\n    def method(self):\n        return 1\n"
+    expected = "    @decorator(\n      arg,\n    )\n    def method(self):\n        return 1\n    "
 
+    assert normalize_source_lines(source) == expected
 
-def test_normalize_source_lines_def_starting_decorator_parameter() -> None:
-    source = """
-    @_with_parameters(
-        _Parameter("self", _Parameter.POSITIONAL_OR_KEYWORD),
-        *_proxy_instantiation_parameters,
-        _project_id,
-        _Parameter(
-            "node_numbers",
-            _Parameter.POSITIONAL_OR_KEYWORD,
-            default=None,
-            annotation=Optional[Iterable[int]],
-        ),
-    )
-    def __init__(bound_args):  # noqa: N805
-        ...
-    """
 
-    expected = """
-    @_with_parameters(
-        _Parameter("self", _Parameter.POSITIONAL_OR_KEYWORD),
-        *_proxy_instantiation_parameters,
-        _project_id,
-        _Parameter(
-            "node_numbers",
-            _Parameter.POSITIONAL_OR_KEYWORD,
-            default=None,
-            annotation=Optional[Iterable[int]],
-        ),
-    )
-    def __init__(bound_args):  # noqa: N805
-        ...
-    """
+def test_normalize_source_lines_indented_async_def() -> None:
+    source = "# comment\n  async def method(self):\n      await other()"
+    expected = "  # comment\n  async def method(self):\n      await other()"
 
-    assert normalize_source_lines(dedent(source)) == dedent(expected)
+    assert normalize_source_lines(source) == expected
 
 
 @pytest.mark.parametrize("obj", [cmp_to_key, 1])
 def test_default_no_signature(obj: Any) -> None:
-    config = create_autospec(
-        Config,
+    config = _conf(
         typehints_fully_qualified=False,
         simplify_optional_unions=False,
         typehints_formatter=None,
         autodoc_mock_imports=[],
+        autodoc_type_aliases={},
     )
-    app: Sphinx = create_autospec(Sphinx, config=config)
+    app = typing.cast("Sphinx", types.SimpleNamespace(config=config))
     lines: list[str] = []
     process_docstring(app, "what", "name", obj, None, lines)
     assert lines == []
@@ -798,8 +789,7 @@ def test_default_no_signature(obj: Any) -> None:
 
 @pytest.mark.parametrize("method", [HintedMethods.from_magic, HintedMethods().method])
 def test_bound_class_method(method: FunctionType) -> None:
-    config = create_autospec(
-        Config,
+    config = _conf(
         typehints_fully_qualified=False,
         simplify_optional_unions=False,
         typehints_document_rtype=False,
@@ -807,8 +797,9 @@ def test_bound_class_method(method: FunctionType) -> None:
         typehints_defaults=True,
         typehints_formatter=None,
         autodoc_mock_imports=[],
+        autodoc_type_aliases={},
     )
-    app: Sphinx = create_autospec(Sphinx, config=config)
+    app = typing.cast("Sphinx", types.SimpleNamespace(config=config))
     process_docstring(app, "class", method.__qualname__, method, None, [])
 
 
@@ -830,10 +821,8 @@ def test_resolve_typing_guard_imports(app: SphinxTestApp, status: StringIO, warn
     out = status.getvalue()
     assert "build succeeded" in out
     err = warning.getvalue()
-    r = re.compile(r"WARNING: Failed guarded type import")
-    assert len(r.findall(err)) == 1
-    pat = r'WARNING: Failed guarded type import with ImportError\("cannot import name \'missing\' from \'functools\''
-    assert re.search(pat, err)
+    assert err.count("WARNING: Failed guarded type import") == 1
+    assert "WARNING: Failed guarded type import with ImportError(\"cannot import name 'missing' from 'functools'" in err
 
 
 @pytest.mark.sphinx("text", testroot="resolve-typing-guard-tmp")
@@ -845,16 +834,14 @@ def test_resolve_typing_guard_attrs_imports(app: SphinxTestApp, status: StringIO
 
 
 def test_no_source_code_type_guard() -> None:
-    from csv import Error  # noqa: PLC0415
-
-    _resolve_type_guarded_imports([], Error)
+    _resolve_type_guarded_imports([], csv.Error)
 
 
 @pytest.mark.sphinx("text", testroot="dummy")
 @patch("sphinx.writers.text.MAXWIDTH", 2000)
 def test_sphinx_output_formatter_no_use_rtype(app: SphinxTestApp, status: StringIO) -> None:
     set_python_path()
-    app.config.master_doc = "simple_no_use_rtype"  # create flag
+    set_master_doc(app, "simple_no_use_rtype")
     app.config.typehints_use_rtype = False
     app.build()
     assert "build succeeded" in status.getvalue()
@@ -915,99 +902,42 @@ def test_sphinx_output_formatter_no_use_rtype(app: SphinxTestApp, status: String
     assert text_contents == dedent(expected_contents)
 
 
+@pytest.mark.parametrize(
+    ("use_signature", "use_signature_return", "signature"),
+    [
+        pytest.param(True, False, "(x: bool, y: int = 1)", id="signature"),
+        pytest.param(False, True, "(x, y=1) -> str", id="signature_return"),
+        pytest.param(True, True, "(x: bool, y: int = 1) -> str", id="signature_and_return"),
+    ],
+)
 @pytest.mark.sphinx("text", testroot="dummy")
 @patch("sphinx.writers.text.MAXWIDTH", 2000)
-def test_sphinx_output_with_use_signature(app: SphinxTestApp, status: StringIO) -> None:
-    set_python_path()
-    app.config.master_doc = "simple"  # create flag
-    app.config.typehints_use_signature = True
-    app.build()
-    assert "build succeeded" in status.getvalue()
-    text_path = Path(app.srcdir) / "_build" / "text" / "simple.txt"
-    text_contents = text_path.read_text().replace("–", "--")  # noqa: RUF001 # keep ambiguous EN DASH
-    expected_contents = """\
-    Simple Module
-    *************
-
-    dummy_module_simple.function(x: bool, y: int = 1)
-
-       Function docstring.
-
-       Parameters:
-          * **x** ("bool") -- foo
-
-          * **y** ("int") -- bar
-
-       Return type:
-          "str"
-    """
-    assert text_contents == dedent(expected_contents)
-
-
-@pytest.mark.sphinx("text", testroot="dummy")
-@patch("sphinx.writers.text.MAXWIDTH", 2000)
-def test_sphinx_output_with_use_signature_return(app: SphinxTestApp, status: StringIO) -> None:
-    set_python_path()
-    app.config.master_doc = "simple"  # create flag
-    app.config.typehints_use_signature_return = True
-    app.build()
-    assert "build succeeded" in status.getvalue()
-    text_path = Path(app.srcdir) / "_build" / "text" / "simple.txt"
-    text_contents = text_path.read_text().replace("–", "--")  # noqa: RUF001 # keep ambiguous EN DASH
-    expected_contents = """\
-    Simple Module
-    *************
-
-    dummy_module_simple.function(x, y=1) -> str
-
-       Function docstring.
-
-       Parameters:
-          * **x** ("bool") -- foo
-
-          * **y** ("int") -- bar
-
-       Return type:
-          "str"
-    """
-    assert text_contents == dedent(expected_contents)
-
-
-@pytest.mark.sphinx("text", testroot="dummy")
-@patch("sphinx.writers.text.MAXWIDTH", 2000)
-def test_sphinx_output_with_use_signature_and_return(app: SphinxTestApp, status: StringIO) -> None:
+def test_sphinx_output_with_use_signature(
+    app: SphinxTestApp,
+    status: StringIO,
+    use_signature: bool,
+    use_signature_return: bool,
+    signature: str,
+) -> None:
     set_python_path()
-    app.config.master_doc = "simple"  # create flag
-    app.config.typehints_use_signature = True
-    app.config.typehints_use_signature_return = True
+    set_master_doc(app, "simple")
+    app.config.typehints_use_signature = use_signature
+    app.config.typehints_use_signature_return = use_signature_return
     app.build()
     assert "build succeeded" in status.getvalue()
     text_path = Path(app.srcdir) / "_build" / "text" / "simple.txt"
     text_contents = text_path.read_text().replace("–", "--")  # noqa: RUF001 # keep ambiguous EN DASH
-    expected_contents = """\
-    Simple Module
-    *************
-
-    dummy_module_simple.function(x: bool, y: int = 1) -> str
-
-       Function docstring.
-
-       Parameters:
-          * **x** ("bool") -- foo
-
-          * **y** ("int") -- bar
-
-       Return type:
-          "str"
-    """
-    assert text_contents == dedent(expected_contents)
+    expected_contents = _EXPECTED_SIMPLE.format(
+        signature=signature, x='("bool") -- foo', y='("int") -- bar', rtype='"str"'
+    )
+    assert text_contents == expected_contents
 
 
 @pytest.mark.sphinx("text", testroot="dummy")
 @patch("sphinx.writers.text.MAXWIDTH", 2000)
 def test_default_annotation_without_typehints(app: SphinxTestApp, status: StringIO) -> None:
     set_python_path()
-    app.config.master_doc = "without_complete_typehints"  # create flag
+    set_master_doc(app, "without_complete_typehints")
     app.config.typehints_defaults = "comma"
     app.build()
     assert "build succeeded" in status.getvalue()
@@ -1067,7 +997,7 @@ def test_default_annotation_without_typehints(app: SphinxTestApp, status: String
 def test_wrong_module_path(app: SphinxTestApp, status: StringIO, warning: StringIO) -> None:
     set_python_path()
 
-    app.config.master_doc = "wrong_module_path"  # create flag
+    set_master_doc(app, "wrong_module_path")
     app.config.default_role = "literal"
     app.config.nitpicky = True
     app.config.nitpick_ignore = {("py:data", "typing.Optional")}